@@ -1,79 +1,344 @@
 #!/usr/bin/env python3
 import asyncio
+import ctypes
+import ctypes.util
 import socket
 import sys
-import datetime
 import argparse
-from typing import List, Tuple
+import functools
+from typing import Awaitable, Callable, Coroutine, List, Optional, Tuple
 import logging
+import multiprocessing
 import os
-import subprocess
+import time
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (and unavailable on Windows); fall back to the stock event loop
+    uvloop = None
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_local_v6() -> Tuple[Tuple[str, str], ...]:
+    """Resolve this host's IPv6 addresses once per process as (name, address) pairs."""
+    return tuple(
+        (interface[3], interface[4][0])
+        for interface in socket.getaddrinfo(host=socket.gethostname(), port=None, family=socket.AF_INET6,
+                                            proto=socket.IPPROTO_TCP, flags=socket.AI_NUMERICSERV)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _ipv6_disabled() -> Optional[bool]:
+    """Return whether IPv6 is disabled system-wide (Linux), or None if it cannot be read."""
+    try:
+        fd = os.open('/proc/sys/net/ipv6/conf/all/disable_ipv6', os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 2)[:1] == b'1'
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _ipv6_forwarding() -> Optional[int]:
+    """Return the net.inet6.ip6.forwarding sysctl (macOS/BSD), or None if unavailable."""
+    libc_name = ctypes.util.find_library('c')
+    if libc_name is None:
+        return None
+    try:
+        sysctlbyname = ctypes.CDLL(libc_name).sysctlbyname
+    except (OSError, AttributeError):
+        return None
+    value = ctypes.c_int(0)
+    size = ctypes.c_size_t(ctypes.sizeof(value))
+    if sysctlbyname(b'net.inet6.ip6.forwarding', ctypes.byref(value), ctypes.byref(size), None, ctypes.c_size_t(0)) != 0:
+        return None
+    return value.value
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
+def _port(value: str) -> int:
+    """argparse type for a TCP port number."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if not 0 <= number <= 65535:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 65535, got {number}")
+    return number
+
+
+class LineProtocol(asyncio.BufferedProtocol):
+    """Protocol that splits the incoming byte stream into newline-terminated lines.
+
+    The transport receives directly into a per-connection bytearray and lines are
+    parsed in place; unread bytes live in buf[start:end].
+    """
+
+    WRITE_BUFFER_HIGH_WATER = 1 << 20
+    # Matches the asyncio.StreamReader default limit
+    READ_BUFFER_HIGH_WATER = 64 * 1024
+    RECV_BUFFER_SIZE = 4096
+    MAX_LINE_LENGTH = 64 * 1024
+
+    def __init__(self, client_connected_cb: Optional[Callable[['LineProtocol'], Awaitable[None]]] = None):
+        self.transport: Optional[asyncio.Transport] = None
+        self._client_connected_cb = client_connected_cb
+        self._task: Optional[asyncio.Task] = None
+        self._lines: asyncio.Queue = asyncio.Queue()
+        self._queued_bytes = 0
+        self._reading_paused = False
+        self._eof = False
+        self._buf = bytearray(self.RECV_BUFFER_SIZE)
+        self._start = 0
+        self._end = 0
+        self._paused = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._closed = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+        # A high write limit keeps short responses from toggling pause/resume.
+        transport.set_write_buffer_limits(high=self.WRITE_BUFFER_HIGH_WATER)
+        if self._client_connected_cb is not None:
+            self._task = asyncio.get_running_loop().create_task(self._client_connected_cb(self))
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        buf = self._buf
+        unread = self._end - self._start
+        if unread == len(buf):
+            # A single line fills the buffer; buffer_updated caps the growth at MAX_LINE_LENGTH
+            size = min(len(buf) * 2, self.MAX_LINE_LENGTH)
+        elif len(buf) > self.RECV_BUFFER_SIZE and unread < self.RECV_BUFFER_SIZE:
+            # Give memory back once a long line has been consumed
+            size = self.RECV_BUFFER_SIZE
+        else:
+            size = 0
+        if size:
+            # Copy into a new buffer rather than resizing: the view returned by the
+            # previous call may still be exported (e.g. by the proactor and SSL transports)
+            self._buf = bytearray(size)
+            self._buf[:unread] = buf[self._start:self._end]
+            buf = self._buf
+            self._start = 0
+            self._end = unread
+        elif self._start > len(buf) // 2 or self._end == len(buf):
+            # Move the unread tail to the front once instead of on every line;
+            # a same-size slice assignment is allowed while the buffer is exported
+            buf[:unread] = buf[self._start:self._end]
+            self._start = 0
+            self._end = unread
+        return memoryview(buf)[self._end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        buf = self._buf
+        start = self._start
+        end = self._end + nbytes
+        newline = buf.find(b'\n', self._end, end)
+        while newline != -1:
+            with memoryview(buf) as view:
+                self._lines.put_nowait(bytes(view[start:newline + 1]))
+            self._queued_bytes += newline + 1 - start
+            start = newline + 1
+            newline = buf.find(b'\n', start, end)
+        if start == end:
+            start = end = 0
+        elif end - start >= self.MAX_LINE_LENGTH:
+            # Drop the oversized line and fail the next readline() instead of buffering more
+            self._lines.put_nowait(ValueError(f"Line exceeds {self.MAX_LINE_LENGTH} bytes"))
+            start = end = 0
+            self.transport.close()
+        self._start = start
+        self._end = end
+        # Stop reading until the handler catches up, pushing back on the sender over TCP
+        if self._queued_bytes > self.READ_BUFFER_HIGH_WATER and not self._reading_paused:
+            self._reading_paused = True
+            self.transport.pause_reading()
+
+    def _feed_eof(self) -> None:
+        # Hand out any unterminated tail, then an empty line to signal EOF.
+        if self._eof:
+            return
+        self._eof = True
+        if self._end > self._start:
+            self._lines.put_nowait(bytes(self._buf[self._start:self._end]))
+            self._queued_bytes += self._end - self._start
+            self._start = self._end = 0
+        self._lines.put_nowait(b'')
+
+    def eof_received(self) -> bool:
+        self._feed_eof()
+        # Keep the write side open so replies to already received lines still go out
+        return True
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        # Normally a no-op after eof_received; covers resets and locally closed connections
+        self._feed_eof()
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            if exc is None:
+                self._drain_waiter.set_result(None)
+            else:
+                self._drain_waiter.set_exception(exc)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+
+    async def readline(self) -> bytes:
+        """Return the next line including its newline, or b'' at EOF.
+
+        Raises ValueError if the peer sent a line longer than MAX_LINE_LENGTH.
+        """
+        line = await self._lines.get()
+        if isinstance(line, Exception):
+            raise line
+        self._queued_bytes -= len(line)
+        if self._reading_paused and self._queued_bytes <= self.READ_BUFFER_HIGH_WATER:
+            self._reading_paused = False
+            if not self.transport.is_closing():
+                self.transport.resume_reading()
+        return line
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer drops below the high-water mark."""
+        if self.transport.is_closing():
+            raise ConnectionResetError("Connection lost")
+        if not self._paused:
+            return
+        self._drain_waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self._drain_waiter
+        finally:
+            self._drain_waiter = None
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection has been lost."""
+        await self._closed
+
 
 class IPv6Tester:
     DEFAULT_PORT = 8080
     DEFAULT_IPV6_ADDRESS = "::1"
     MAX_CLIENTS = 10
+    LISTEN_BACKLOG = 65535
     DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+    CLIENT_GREETING = b"Hello from IPv6 client at "
+    RESPONSE_PREFIX = b"Server received your message at "
+    RESPONSE_ADDRESS = b" at address "
+    RECV_BUFFER_SIZE = 4096
+    SEND_BUFFER_SIZE = 128
+    SOCKET_BUFFER_SIZE = 256 * 1024
+
+    # Last formatted timestamp, shared by all connections and refreshed once per second
+    _ts_sec = 0
+    _ts_str = b""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(message)s')
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        self.configure_logging(logging.INFO)
+        self.socket_buffer_size = self.SOCKET_BUFFER_SIZE
+        self.io_backend = 'auto'
+
+    def configure_logging(self, level: int) -> None:
+        """Set the logger level and attach the message-only console handler if it is missing."""
+        self.logger.setLevel(level)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
 
     def print_usage(self) -> None:
         """Print usage information and available IPv6 addresses."""
-        self.logger.info("Usage: python ipv6_tester.py <server|client> [ipv6_address] [port]")
-        self.logger.info("  server|client    - Required. Run as server or client")
-        self.logger.info("  ipv6_address     - Optional. IPv6 address (default: ::1)")
-        self.logger.info("  port             - Optional. Port number (default: 8080)")
-        
-        self.logger.info("\nAvailable IPv6 addresses on this host:")
-        self.print_available_ipv6_addresses()
-        
-        self.logger.info("\nPython IPv6 related properties:")
-        self.logger.info(f"  socket.AF_INET6: {socket.AF_INET6}")
-        self.logger.info(f"  socket.has_ipv6: {socket.has_ipv6}")
-        self.logger.info(f"  environment variable IPV6_V6ONLY: {os.environ.get('IPV6_V6ONLY', 'not set')}")
-        
+        lines = [
+            self.build_parser().format_help().rstrip(),
+            "\nAvailable IPv6 addresses on this host:",
+        ]
+        lines.extend(self.available_ipv6_address_lines())
+
+        lines.append("\nPython IPv6 related properties:")
+        lines.append(f"  socket.AF_INET6: {socket.AF_INET6}")
+        lines.append(f"  socket.has_ipv6: {socket.has_ipv6}")
+        lines.append(f"  environment variable IPV6_V6ONLY: {os.environ.get('IPV6_V6ONLY', 'not set')}")
+
         # Check system IPv6 configuration
+        ipv6_disabled = _ipv6_disabled()
+        if ipv6_disabled is not None:
+            lines.append(f"  System IPv6 enabled: {not ipv6_disabled}")
+        else:
+            # Not on Linux, try the macOS sysctl
+            ipv6_forwarding = _ipv6_forwarding()
+            if ipv6_forwarding is not None:
+                lines.append(f"  System IPv6 forwarding: net.inet6.ip6.forwarding: {ipv6_forwarding}")
+            else:
+                lines.append("  System IPv6 status: Unable to determine")
+
+        lines.append("\nExamples:")
+        lines.append("  python ipv6_tester.py server")
+        lines.append("  python ipv6_tester.py server 2001:db8:1234:5678::1")
+        lines.append("  python ipv6_tester.py client 2001:db8:1234:5678::1 8888")
+
+        # One write for the whole text instead of a logging call per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def available_ipv6_address_lines(self) -> List[str]:
+        """Return one formatted line per available IPv6 address on the system."""
         try:
-            with open('/proc/sys/net/ipv6/conf/all/disable_ipv6', 'r') as f:
-                ipv6_disabled = f.read().strip() == '1'
-            self.logger.info(f"  System IPv6 enabled: {not ipv6_disabled}")
-        except FileNotFoundError:
-            # Not on Linux, try macOS
-            try:
-                import subprocess
-                result = subprocess.run(['sysctl', 'net.inet6.ip6.forwarding'], 
-                                     capture_output=True, text=True)
-                self.logger.info(f"  System IPv6 forwarding: {result.stdout.strip()}")
-            except FileNotFoundError:
-                self.logger.info("  System IPv6 status: Unable to determine")
-        
-        self.logger.info("\nExamples:")
-        self.logger.info("  python ipv6_tester.py server")
-        self.logger.info("  python ipv6_tester.py server 2001:db8:1234:5678::1")
-        self.logger.info("  python ipv6_tester.py client 2001:db8:1234:5678::1 8888")
-
-    def print_available_ipv6_addresses(self) -> None:
-        """Print all available IPv6 addresses on the system."""
-        try:
-            ipv6_addresses = [
-                f"  {interface[3]}: {interface[4][0]}"
-                for interface in socket.getaddrinfo(host=socket.gethostname(), port=None, family=socket.AF_INET6, proto=socket.IPPROTO_TCP)
-            ]
-            for addr in ipv6_addresses:
-                self.logger.info(addr)
-        except Exception as e:
+            return [f"  {name}: {addr}" for name, addr in _resolve_local_v6()]
+        except socket.gaierror as e:
             self.logger.error(f"Error getting network interfaces: {e}")
+            return []
+
+    @classmethod
+    def timestamp_bytes(cls) -> bytes:
+        """Return the current time formatted with DATE_FORMAT, reusing the result within a second."""
+        second = int(time.time())
+        if second != cls._ts_sec:
+            cls._ts_sec = second
+            cls._ts_str = time.strftime(cls.DATE_FORMAT, time.localtime(second)).encode()
+        return cls._ts_str
 
-    def log_socket_properties(self, writer: asyncio.StreamWriter, context: str) -> None:
-        """Log IPv6 properties of a socket from a stream writer."""
+    @staticmethod
+    def decode_line(data: bytes) -> str:
+        """Decode a received line for display, dropping its line terminator."""
+        if data.endswith(b'\r\n'):
+            data = data[:-2]
+        elif data.endswith(b'\n'):
+            data = data[:-1]
+        # Messages are ASCII timestamps and greetings; anything else is replaced
+        return data.decode('ascii', 'replace')
+
+    def tune_socket(self, sock: socket.socket) -> None:
+        """Disable Nagle's algorithm and enlarge the kernel send and receive buffers."""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer_size)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer_size)
+
+    def log_socket_properties(self, sock: socket.socket, context: str) -> None:
+        """Log IPv6 properties of a socket."""
         try:
-            sock = writer.get_extra_info('socket')
             self.logger.info(f"\nSocket properties for {context}:")
             self.logger.info(f"  Socket family: {sock.family}")
             self.logger.info(f"  Socket type: {sock.type}")
@@ -82,28 +347,39 @@ class IPv6Tester:
         except Exception as e:
             self.logger.error(f"Could not get socket properties for {context}: {e}")
 
-    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, server_address: str) -> None:
-        """Handle individual client connections."""
-        client_address = writer.get_extra_info('peername')[0]
+    async def handle_client(self, protocol: LineProtocol, server_address: bytes) -> None:
+        """Handle individual client connections.
+
+        server_address is the ASCII-encoded address the server is bound to.
+        """
+        transport = protocol.transport
+        client_address = transport.get_extra_info('peername')[0]
         self.logger.info(f"Client connected from: [{client_address}]")
-        self.log_socket_properties(writer, f"client connection from [{client_address}]")
+        # Accepted sockets match the listener logged at startup; only repeat this when debugging
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.log_socket_properties(transport.get_extra_info('socket'), f"client connection from [{client_address}]")
 
         try:
             while True:
                 # Read client message
-                data = await reader.readline()
+                data = await protocol.readline()
                 if not data:
                     self.logger.info(f"Client disconnected: [{client_address}]")
                     break
 
-                message = data.decode().strip()
-                self.logger.info(f"Received from client [{client_address}]: {message}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Received from client [%s]: %s", client_address, self.decode_line(data))
 
                 # Send response with timestamp
-                timestamp = datetime.datetime.now().strftime(self.DATE_FORMAT)
-                response = f"Server received your message at {timestamp} at address {server_address}\n"
-                writer.write(response.encode())
-                await writer.drain()
+                # Hand the fragments over as-is; the transport can send them as one iovec
+                transport.writelines([
+                    self.RESPONSE_PREFIX,
+                    self.timestamp_bytes(),
+                    self.RESPONSE_ADDRESS,
+                    server_address,
+                    b"\n",
+                ])
+                await protocol.drain()
 
                 # Add a delay of 1 second
                 await asyncio.sleep(1)
@@ -111,80 +387,203 @@ class IPv6Tester:
         except Exception as e:
             self.logger.error(f"Error handling client [{client_address}]: {e}")
         finally:
-            writer.close()
-            await writer.wait_closed()
+            transport.close()
+            await protocol.wait_closed()
 
-    async def run_server(self, ipv6_address: str, port: int) -> None:
-        """Run the IPv6 server."""
+    async def run_server(self, ipv6_address: str, port: int, reuse_port: bool = False) -> None:
+        """Run the IPv6 server.
+
+        With reuse_port, several processes can bind the same address and port and
+        the kernel load-balances incoming connections between them.
+        """
         try:
-            server = await asyncio.start_server(
-                lambda r, w: self.handle_client(r, w, ipv6_address),
+            loop = asyncio.get_running_loop()
+            # Encoded once here rather than for every response
+            server_address = ipv6_address.encode('ascii')
+            server = await loop.create_server(
+                lambda: LineProtocol(lambda p: self.handle_client(p, server_address)),
                 ipv6_address,
                 port,
-                family=socket.AF_INET6
+                family=socket.AF_INET6,
+                backlog=self.LISTEN_BACKLOG,
+                reuse_port=reuse_port
             )
+            # Accepted connections inherit these options from the listening sockets
+            for sock in server.sockets:
+                self.tune_socket(sock)
             self.logger.info(f"IPv6 Server started on [{ipv6_address}]:{port}")
             self.logger.info(f"Maximum number of simultaneous clients: {self.MAX_CLIENTS}")
+            for sock in server.sockets:
+                self.log_socket_properties(sock, f"server listening on [{ipv6_address}]:{port}")
 
             async with server:
                 await server.serve_forever()
         except Exception as e:
             self.logger.error(f"Server error: {e}")
 
+    async def recv_line(self, sock: socket.socket, buf: bytearray, end: int) -> Tuple[bytes, int]:
+        """Receive one newline-terminated line into buf, which holds end unread bytes.
+
+        Returns the line and the number of unread bytes left at the start of buf.
+        """
+        loop = asyncio.get_running_loop()
+        newline = buf.find(b'\n', 0, end)
+        while newline == -1:
+            if end == len(buf):
+                raise ValueError(f"Line exceeds {len(buf)} byte receive buffer")
+            with memoryview(buf) as view:
+                received = await loop.sock_recv_into(sock, view[end:])
+            if not received:
+                raise ConnectionResetError("Server closed the connection")
+            newline = buf.find(b'\n', end, end + received)
+            end += received
+        line = bytes(buf[:newline + 1])
+        remaining = end - newline - 1
+        buf[:remaining] = buf[newline + 1:end]
+        return line, remaining
+
     async def run_client(self, ipv6_address: str, port: int) -> None:
         """Run the IPv6 client."""
         try:
-            reader, writer = await asyncio.open_connection(
-                ipv6_address,
-                port,
-                family=socket.AF_INET6
-            )
-            self.logger.info(f"Connected to server at [{ipv6_address}]:{port}")
-            self.log_socket_properties(writer, f"client connection to [{ipv6_address}]:{port}")
+            loop = asyncio.get_running_loop()
+            addrinfo = await loop.getaddrinfo(ipv6_address, port, family=socket.AF_INET6, type=socket.SOCK_STREAM)
+            family, sock_type, proto, _, sockaddr = addrinfo[0]
+            sock = socket.socket(family, sock_type, proto)
+            sock.setblocking(False)
 
             try:
+                # Set before connecting so the larger receive window is used from the handshake on
+                self.tune_socket(sock)
+                await loop.sock_connect(sock, sockaddr)
+                self.logger.info(f"Connected to server at [{ipv6_address}]:{port}")
+                self.log_socket_properties(sock, f"client connection to [{ipv6_address}]:{port}")
+
+                # Responses are read into one buffer that is reused for every iteration
+                buf = bytearray(self.RECV_BUFFER_SIZE)
+                end = 0
+                # Messages are built in place behind a greeting written once
+                send_buf = bytearray(self.SEND_BUFFER_SIZE)
+                greeting_end = len(self.CLIENT_GREETING)
+                send_buf[:greeting_end] = self.CLIENT_GREETING
+                send_view = memoryview(send_buf)
                 for i in range(20):
                     # Send message to server
-                    timestamp = datetime.datetime.now().strftime(self.DATE_FORMAT)
-                    message = f"Hello from IPv6 client at {timestamp}\n"
-                    writer.write(message.encode())
-                    await writer.drain()
-                    self.logger.info(f"Sent to server: {message.strip()}")
+                    timestamp = self.timestamp_bytes()
+                    message_end = greeting_end + len(timestamp)
+                    send_buf[greeting_end:message_end] = timestamp
+                    send_buf[message_end] = 0x0a
+                    await loop.sock_sendall(sock, send_view[:message_end + 1])
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Sent to server: Hello from IPv6 client at %s", timestamp.decode('ascii'))
 
                     # Read server response
-                    response = await reader.readline()
-                    self.logger.info(f"Server response: {response.decode().strip()}")
+                    response, end = await self.recv_line(sock, buf, end)
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Server response: %s", self.decode_line(response))
 
                     # Wait 1 second before next iteration
                     if i < 19:
                         await asyncio.sleep(1)
 
             finally:
-                writer.close()
-                await writer.wait_closed()
+                sock.close()
 
         except Exception as e:
             self.logger.error(f"Client error: {e}")
 
+    def event_loop_factory(self) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+        """Return the event loop factory for the selected I/O backend, or None for the stock loop.
+
+        'auto' picks uvloop when it is installed and 'asyncio' forces the stock selector loop.
+        """
+        if self.io_backend == 'asyncio' or uvloop is None:
+            return None
+        return uvloop.new_event_loop
+
+    def run(self, coro: Coroutine) -> None:
+        """Run a coroutine to completion on the selected I/O backend."""
+        with asyncio.Runner(loop_factory=self.event_loop_factory()) as runner:
+            runner.run(coro)
+
+    def run_server_worker(self, ipv6_address: str, port: int, log_level: int) -> None:
+        """Entry point for a server worker process.
+
+        Under the spawn and forkserver start methods the worker gets an unpickled
+        tester whose logger was never configured, so logging is set up again here.
+        """
+        self.configure_logging(log_level)
+        try:
+            self.run(self.run_server(ipv6_address, port, reuse_port=True))
+        except KeyboardInterrupt:
+            pass
+
+    def serve(self, ipv6_address: str, port: int, workers: int) -> None:
+        """Run the server in this process, or in several worker processes sharing the port."""
+        if workers <= 1:
+            self.run(self.run_server(ipv6_address, port))
+            return
+
+        processes = [
+            multiprocessing.Process(target=self.run_server_worker,
+                                    args=(ipv6_address, port, self.logger.level))
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            # Workers receive the same SIGINT; wait for them to shut down
+            for process in processes:
+                process.join()
+            raise
+
+    def build_parser(self) -> argparse.ArgumentParser:
+        """Build the command line parser; print_usage reuses its help text."""
+        parser = argparse.ArgumentParser(prog='ipv6_tester.py', description="IPv6 client/server tester")
+        parser.add_argument('mode', nargs='?', choices=['server', 'client'],
+                            help="run as server or client")
+        parser.add_argument('address', nargs='?', default=self.DEFAULT_IPV6_ADDRESS,
+                            help=f"IPv6 address (default: {self.DEFAULT_IPV6_ADDRESS})")
+        parser.add_argument('port', nargs='?', type=_port, default=self.DEFAULT_PORT,
+                            help=f"port number (default: {self.DEFAULT_PORT})")
+        parser.add_argument('--workers', type=_positive_int, default=1, metavar='N',
+                            help="server processes sharing the port via SO_REUSEPORT (default: 1)")
+        parser.add_argument('--log-level', type=str.upper, default='INFO', metavar='LEVEL',
+                            choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                            help="logging level; WARNING silences per-message logs (default: INFO)")
+        parser.add_argument('--buf-size', type=_positive_int, default=self.SOCKET_BUFFER_SIZE, metavar='BYTES',
+                            help=f"socket send/receive buffer size (default: {self.SOCKET_BUFFER_SIZE})")
+        parser.add_argument('--io-backend', default='auto', choices=['auto', 'asyncio', 'uvloop'], metavar='BACKEND',
+                            help="event loop: auto, asyncio or uvloop; auto uses uvloop when installed (default: auto)")
+        return parser
+
     def main(self) -> None:
         """Main entry point for the IPv6 tester."""
-        if len(sys.argv) < 2:
-            self.print_usage()
-            sys.exit(1)
+        parser = self.build_parser()
+        args = parser.parse_args()
+        if args.io_backend == 'uvloop' and uvloop is None:
+            parser.error("I/O backend 'uvloop' requested but uvloop is not installed")
+        if args.mode == 'client' and args.workers != 1:
+            parser.error("--workers only applies to server mode")
 
-        mode = sys.argv[1]
-        ipv6_address = sys.argv[2] if len(sys.argv) > 2 else self.DEFAULT_IPV6_ADDRESS
-        port = int(sys.argv[3]) if len(sys.argv) > 3 else self.DEFAULT_PORT
-
-        if mode not in ['server', 'client']:
+        if args.mode is None:
             self.print_usage()
             sys.exit(1)
 
+        self.configure_logging(getattr(logging, args.log_level))
+        self.socket_buffer_size = args.buf_size
+        self.io_backend = args.io_backend
+        mode = args.mode
+        ipv6_address = args.address
+        port = args.port
+
         try:
             if mode == 'server':
-                asyncio.run(self.run_server(ipv6_address, port))
+                self.serve(ipv6_address, port, args.workers)
             else:
-                asyncio.run(self.run_client(ipv6_address, port))
+                self.run(self.run_client(ipv6_address, port))
         except KeyboardInterrupt:
             self.logger.info("\nShutting down...")
         except Exception as e: